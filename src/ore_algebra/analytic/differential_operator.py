@@ -12,7 +12,6 @@ Custom differential operators
 #
 # http://www.gnu.org/licenses/
 
-from sage.arith.all import lcm
 from sage.misc.cachefunc import cached_method
 from sage.rings.all import CIF, QQbar, QQ, ZZ
 from sage.rings.complex_arb import ComplexBallField
@@ -20,6 +19,7 @@ from sage.rings.complex_interval_field import ComplexIntervalField
 from sage.rings.infinity import infinity
 from sage.rings.number_field import number_field_base
 from sage.rings.polynomial.polynomial_ring_constructor import PolynomialRing
+from sage.structure.factorization import Factorization
 
 from ..ore_algebra import OreAlgebra
 from ..differential_operator_1_1 import UnivariateDifferentialOperatorOverUnivariateRing
@@ -48,10 +48,24 @@ class PlainDifferentialOperator(UnivariateDifferentialOperatorOverUnivariateRing
         if not dop.parent().is_D():
             raise ValueError("expected an operator in K(x)[D]")
         _, _, _, dop = dop.numerator()._normalize_base_ring()
-        den = lcm(utilities.internal_denominator(c) for pol in dop for c in pol)
-        dop *= den
+        internal_denominator = utilities.internal_denominator
+        dens = set()
+        add = dens.add
+        for pol in dop:
+            for c in pol:
+                d = internal_denominator(c)
+                if d != 1:
+                    add(d)
+        den = ZZ.one()
+        for d in dens:
+            den = den.lcm(d)
+        if den != 1:
+            dop *= den
         super().__init__(
                 dop.parent(), dop)
+        self._pols = self.base_ring()
+        self._scalars = self._pols.base_ring()
+        self._est_terms_cache = {}
 
     @cached_method
     def _indicial_polynomial_at_zero(self):
@@ -59,27 +73,61 @@ class PlainDifferentialOperator(UnivariateDifferentialOperatorOverUnivariateRing
 
         op = self.numerator()
         R = op.base_ring()
-        y = R.gen()
 
         b = min(c.valuation() - j for j, c in enumerate(op))
 
-        s = R.zero()
-        y_ff_i = R.one()
-        for i, c in enumerate(op):
-            s += c[b + i]*y_ff_i
-            y_ff_i *= y - i
-
-        return s
+        # Accumulate the coefficients of sum(c[b+i]*y(y-1)...(y-i+1)), with the
+        # falling factorials computed on integer coefficient lists
+        lcs = [c[b + i] if c else c for i, c in enumerate(op)]
+        last = max(i for i, a in enumerate(lcs) if a)
+        coeffs = [R.base_ring().zero()]*(last + 1)
+        y_ff_i = [1]
+        for i, a in enumerate(lcs):
+            if a:
+                for k, f in enumerate(y_ff_i):
+                    coeffs[k] += a*f
+                if i == last:
+                    break
+            y_ff_i = [0] + y_ff_i
+            for k in range(i + 1):
+                y_ff_i[k] -= i*y_ff_i[k+1]
+
+        return R(coeffs)
 
     @cached_method
     def _naive_height(self):
+        internal_denominator = utilities.internal_denominator
+        Z = ZZ
         def h(c):
-            den = utilities.internal_denominator(c)
+            den = internal_denominator(c)
             num = den*c
             l = list(num)
             l.append(den)
-            return max(ZZ(a).nbits() for a in l)
-        return max(h(c) for pol in self for c in pol)
+            return max(Z(a).nbits() for a in l)
+        Scalars = self._scalars
+        if Scalars is QQ:
+            # The height is read directly off the numerator and denominator
+            return max(max(c.numerator().nbits(), c.denominator().nbits())
+                       for pol in self for c in pol)
+        if (isinstance(Scalars, number_field_base.NumberField)
+                and Scalars.degree() > 2):
+            # Cheap upper bound on h(c): the internal denominator is the lcm of
+            # those of the coordinates
+            def bound(c):
+                return sum(a.numerator().nbits() + a.denominator().nbits()
+                           for a in c.list())
+        else:
+            # Quadratic fields use a different internal representation
+            bound = None
+        best = 0
+        for pol in self:
+            for c in pol:
+                if bound is not None and bound(c) <= best:
+                    continue
+                hc = h(c)
+                if hc > best:
+                    best = hc
+        return best
 
     @cached_method
     def _my_to_S(self):
@@ -132,16 +180,37 @@ class PlainDifferentialOperator(UnivariateDifferentialOperatorOverUnivariateRing
         # Or maybe a better way to look at this is to say that we are considering
         # the classical Newton polygon at infinity (as in Loday-Richaud 2016,
         # Def. 3.3.10) but we are interested in the inverses of the slopes.
-        points = [(ZZ(j-i), ZZ(i), c) for (i, pol) in enumerate(self)
-                                    for (j, c) in enumerate(pol)
-                                    if not c.is_zero()]
-        h0, i0, _ = max(points, key=lambda p: (p[1], p[0]))
-        hull = [(h, i, c) for (h, i, c) in points if h > h0 and i < i0]
-        if not hull: # generalized polynomial
+        # Only the largest i for each h can lie on the polygon. Since i
+        # increases along the outer loop, later points override earlier ones.
+        top = {}
+        for i, pol in enumerate(self):
+            for j, c in pol.dict().items():
+                top[j-i] = (i, c)
+        # The leading coefficient is a term, so the rightmost point with the
+        # largest i is unique.
+        i0 = self.order()
+        h0 = self.leading_coefficient().degree() - i0
+        # Upper hull to the right of (h0, i0) (monotone chain, keeping
+        # collinear points so that the first edge contains all of them)
+        hull = [(h0, i0)]
+        for h in sorted(top):
+            if h <= h0:
+                continue
+            i = top[h][0]
+            while len(hull) > 1:
+                (ha, ia), (hb, ib) = hull[-2], hull[-1]
+                if (hb - ha)*(i - ia) - (ib - ia)*(h - ha) > 0:
+                    hull.pop()
+                else:
+                    break
+            hull.append((h, i))
+        if len(hull) == 1: # generalized polynomial
             return infinity, ZZ.zero()
-        slope = max((i-i0)/(h-h0) for h, i, c in hull)
-        Pol = self.base_ring()
-        eqn = Pol({i0 - i: c for (h, i, c) in points if i == i0 + slope*(h-h0)})
+        h1, i1 = hull[1]
+        slope = ZZ(i1 - i0)/ZZ(h1 - h0)
+        edge = [h for (h, i) in hull if (i - i0)*(h1 - h0) == (i1 - i0)*(h - h0)]
+        Pol = self._pols
+        eqn = Pol({i0 - top[h][0]: top[h][1] for h in edge})
         expo_growth = abs_min_nonzero_root(eqn, prec=bit_prec)**slope
         return -slope, expo_growth
 
@@ -154,8 +223,12 @@ class PlainDifferentialOperator(UnivariateDifferentialOperatorOverUnivariateRing
         if lc.base_ring() is not QQ: # not worth the effort
             return lc, lc.parent().one()
         dlc = self.desingularize(m=1).leading_coefficient()
+        if dlc == lc: # no apparent singularities
+            return lc, lc.parent().one()
         alc, rem = lc.quo_rem(dlc)
         assert rem.is_zero()
+        if alc.is_constant():
+            return dlc, alc
         # "Partly apparent" factors go in the non-apparent one
         while True:
             g = dlc.gcd(alc)
@@ -179,6 +252,9 @@ class PlainDifferentialOperator(UnivariateDifferentialOperatorOverUnivariateRing
           singularities, with all non-apparent singularities (and, possibly,
           some apparent ones) contained in the subset corresponding to
           ``apparent=False``.
+
+        The singularities are grouped by irreducible factor of the leading
+        coefficient, the factors being sorted as by ``Factorization``.
         """
         if dom is not None or not multiplicities:
             # Memoize the version with all information
@@ -198,27 +274,67 @@ class PlainDifferentialOperator(UnivariateDifferentialOperatorOverUnivariateRing
                     sing = self._singularities.cached(dom, multiplicities, b)
                 except KeyError:
                     continue
-                sing += self._singularities(dom, multiplicities, not b)
-                return sing
+                # Do not extend the cached list in place
+                return sing + self._singularities(dom, multiplicities, not b)
             pol = self.leading_coefficient()
         else:
             dlc, alc = self.split_leading_coefficient()
             pol = alc if apparent else dlc
+        # Only factor the squarefree parts, whose irreducible factors all have
+        # the same multiplicity
+        factors = []
+        for sqf, mult in pol.squarefree_decomposition():
+            if sqf.degree() == 1:
+                factors.append((sqf, mult))
+            else:
+                factors.extend((fac, mult) for fac, _ in sqf.factor())
+        # Sort the factors as in pol.factor(), so that the singularities come
+        # in the same order as when factoring pol directly
         sing = []
-        for fac, mult in pol.factor():
+        for fac, mult in Factorization(factors):
             roots = roots_of_irred(fac)
             sing.extend((rt, mult) for rt in roots)
         return sing
 
+    @cached_method
+    def _lc_radical(self):
+        return self.leading_coefficient().radical()
+
     def _sing_as_alg(self, iv):
-        pol = self.leading_coefficient().radical()
+        pol = self._lc_radical()
         return QQbar.polynomial_root(pol, CIF(iv))
 
     @cached_method
     def est_cvrad(self, IR):
+        r"""
+        TESTS:
+
+        The shortcut for leading coefficients with a single nonzero root agrees
+        with the general computation::
+
+            sage: from ore_algebra import DifferentialOperators
+            sage: from ore_algebra.analytic.differential_operator import DifferentialOperator
+            sage: Dops, x, Dx = DifferentialOperators()
+            sage: dop = DifferentialOperator((x^2 - 3*x)*Dx - 1)
+            sage: sing = [a for a in dop._singularities(CBF) if not a.contains_zero()]
+            sage: dop.est_cvrad(RBF).identical(min(a.below_abs() for a in sing))
+            True
+        """
         # not rigorous! (because of the contains_zero())
         IC = IR.complex_field()
-        sing = [a for a in self._singularities(IC) if not a.contains_zero()]
+        lc = self.leading_coefficient()
+        val = lc.valuation()
+        if (lc.degree() - val <= 1
+                and not isinstance(self, ShiftedDifferentialOperator)):
+            # Avoid factoring the leading coefficient when it has at most one
+            # nonzero root, but convert that root to IC as _singularities does
+            if lc.degree() == val:
+                return IR('inf')
+            rt, = roots_of_irred(lc.shift(-val))
+            sing = [IC(rt)]
+        else:
+            sing = self._singularities(IC)
+        sing = [a for a in sing if not a.contains_zero()]
         if not sing:
             return IR('inf')
         else:
@@ -251,6 +367,19 @@ class PlainDifferentialOperator(UnivariateDifferentialOperatorOverUnivariateRing
         maximum log-magnitude of these terms.
         """
         # pt should be an EvaluationPoint
+        key = (pt.rad, prec, ctx.IR)
+        try:
+            return self._est_terms_cache[key]
+        except KeyError:
+            pass
+        except TypeError: # unhashable radius
+            key = None
+        res = self._est_terms(pt, prec, ctx)
+        if key is not None:
+            self._est_terms_cache[key] = res
+        return res
+
+    def _est_terms(self, pt, prec, ctx):
         prec = ctx.IR(prec)
         cvrad = self.est_cvrad(ctx.IR)
         if cvrad.is_infinity():
@@ -272,8 +401,8 @@ class PlainDifferentialOperator(UnivariateDifferentialOperatorOverUnivariateRing
         Extend the ground field so that the new field contains pts.
         """
         Dops = self.parent()
-        Pols = Dops.base_ring()
-        Scalars = Pols.base_ring()
+        Pols = self._pols
+        Scalars = self._scalars
         if all(Scalars.has_coerce_map_from(pt.parent()) for pt in pts):
             return (self,) + pts
         hom, *pts1 = utilities.extend_scalars(Scalars, *pts)
@@ -281,7 +410,7 @@ class PlainDifferentialOperator(UnivariateDifferentialOperatorOverUnivariateRing
                 (Dops.variable_name(), {}, {Pols.gen(): Pols.one()}))
         dop1 = Dops1([pol.map_coefficients(hom) for pol in self])
         dop1 = PlainDifferentialOperator(dop1)
-        assert dop1.base_ring().base_ring() is hom.codomain()
+        assert dop1._scalars is hom.codomain()
         return (dop1,) + tuple(pts1)
 
     def shift(self, delta):
@@ -303,15 +432,16 @@ class PlainDifferentialOperator(UnivariateDifferentialOperatorOverUnivariateRing
         # PolynomialRing(L, x) sometimes return objects over K found in cache,
         # leading to endless headaches with slow coercions.
         dop_P, ex = self.extend_scalars(delta.exact().as_sage_value())
-        Pols = dop_P.base_ring()
+        Pols = dop_P._pols
         # Gcd-avoiding shift by an algebraic delta
         deg = dop_P.degree()
         den = utilities.internal_denominator(ex)
         num = den*ex
         lin = Pols([num, den])
-        x = Pols.gen()
+        # pol.reverse(deg)(den*x).reverse(deg), coefficient by coefficient
+        den_pows = [den**(deg - i) for i in range(deg + 1)]
         def shift_poly(pol):
-            pol = (pol.reverse(deg)(den*x)).reverse(deg)
+            pol = Pols([c*p for c, p in zip(pol.list(), den_pows)])
             return pol(lin)
         shifted = dop_P.map_coefficients(shift_poly)
         return ShiftedDifferentialOperator(shifted, self, delta)
@@ -324,7 +454,7 @@ class PlainDifferentialOperator(UnivariateDifferentialOperatorOverUnivariateRing
         return OreAlgebra(Pol, 'T'+str(x))
 
     def _theta_alg(self):
-        return self._theta_alg_with_base(self.parent().base_ring().base_ring())
+        return self._theta_alg_with_base(self._scalars)
 
     @cached_method
     def _shift_alg_with_base(self, Scalars):
@@ -332,7 +462,7 @@ class PlainDifferentialOperator(UnivariateDifferentialOperatorOverUnivariateRing
         return OreAlgebra(Pols_n, 'Sn')
 
     def _shift_alg(self):
-        return self._shift_alg_with_base(self.base_ring().base_ring())
+        return self._shift_alg_with_base(self._scalars)
 
 class ShiftedDifferentialOperator(PlainDifferentialOperator):
 
@@ -341,6 +471,7 @@ class ShiftedDifferentialOperator(PlainDifferentialOperator):
         self._orig = orig
         self._delta = delta
 
+    @cached_method
     def _singularities(self, dom, multiplicities=False, apparent=None):
         sing = self._orig._singularities(dom, multiplicities, apparent)
         delta = dom(self._delta.value)
@@ -350,7 +481,7 @@ class ShiftedDifferentialOperator(PlainDifferentialOperator):
             return [s - delta for s in sing]
 
     def _theta_alg(self):
-        return self._orig._theta_alg_with_base(self.base_ring().base_ring())
+        return self._orig._theta_alg_with_base(self._scalars)
 
     def _shift_alg(self):
-        return self._orig._shift_alg_with_base(self.base_ring().base_ring())
+        return self._orig._shift_alg_with_base(self._scalars)
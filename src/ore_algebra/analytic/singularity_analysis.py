@@ -674,9 +674,10 @@ def _classify_sing(deq, known_analytic, rad):
 
     # Interesting points = all sing of the equation, plus the origin
 
+    # (do not modify the list returned by _singularities(), which is cached)
     all_exn_pts = deq._singularities(QQbar, multiplicities=False)
     if not any(s.is_zero() for s in all_exn_pts):
-        all_exn_pts.append(QQbar.zero())
+        all_exn_pts = list(all_exn_pts) + [QQbar.zero()]
 
     # Potential singularities of the function, sorted by magnitude
 
@@ -45,9 +45,11 @@ import sage.functions.other
 import sage.functions.special
 import sage.functions.trig
 
+from sage.misc.cachefunc import cached_function
 from sage.misc.misc_c import prod
 from sage.rings.all import QQ
 
+from functools import lru_cache
 from operator import pow
 
 
@@ -101,162 +103,216 @@ def symbolic_database(A, f, inner=None, k=0):
         sage: h = bessel_I(4,2*x+1).operator()
         sage: symbolic_database(B,h,2*x+1,4)
         (4*x^2 + 4*x + 1)*Dx^2 + (4*x + 2)*Dx - 16*x^2 - 16*x - 68
+        sage: symbolic_database(B,cosh_integral(x).operator())
+        x*Dx^3 + 2*Dx^2 - x*Dx
+
+    The results for functions without ``inner`` and with rational ``k`` are kept in a small
+    cache, since the same functions tend to be looked up over and over again::
+
+        sage: symbolic_database(B,f) is symbolic_database(B,f)
+        True
 
     """
-    n = A.is_S()
-    k = A(k)
+    if f is pow and not _algebra_data(A)[0]:
+        return _sqrt(A, inner)
+    cls = type(f)
+    if inner is None:
+        try:
+            k = QQ(k)
+        except (TypeError, ValueError):
+            pass
+        else:
+            return _cached_symbolic_database(A, cls, k)
+    return _symbolic_database(A, cls, inner, k)
+
+
+@lru_cache(maxsize=128)
+def _cached_symbolic_database(A, cls, k):
+    # Only called without inner function and with rational k, so that no symbolic
+    # expressions end up in the keys of the cache.
+    return _symbolic_database(A, cls, None, k)
+
+
+@cached_function
+def _algebra_data(A):
+    return A.is_S(), A.base_ring()
+
+
+def _inner_data(R, inner):
+    # the inner function and its derivative as elements of R
+    if inner:
+        return R(inner), R(inner.derivative())
+    else:
+        return R.gen(), R.one()
+
+
+def _sqrt(A, inner):
+    x, d = _inner_data(A.base_ring(), inner)
+    return A([d, -2*x])
+
+
+def _symbolic_database(A, cls, inner, k):
+    n, R = _algebra_data(A)
 
     # sequences
     if n:
-        Sn = A.gen()
-
-        # factorial
-        if isinstance(f, sage.functions.other.Function_factorial):
-            return A(Sn - (n+1))
-        # harmonic_number
-        elif isinstance(f, sage.functions.log.Function_harmonic_number_generalized):
-            return A((n+2)*Sn**2 - (2*n+3)*Sn + (n+1))
-        # binomial
-        elif isinstance(f, sage.functions.other.Function_binomial):
-            # (k choose n) - k fixed, n variable
-            if k in QQ:
-                return A((n+1)*Sn - (k-n))
-            # (a*n+b choose c*n+d) - a,b,c,d fixed, n variable
-            else:
-                k = k.constant_coefficient()
-                f1 = prod(inner+i for i in range(1, inner[1]+1))
-                f2 = prod(k+i for i in range(1, k[1]+1))
-                f3 = prod(inner - k + i for i in range(1, inner[1]-k[1]+1))
-            return A(f2*f3*Sn - f1)
-        else:
+        build = _builder(_SEQUENCES, cls)
+        if build is None:
             raise NotImplementedError
+        return A(build(n, R(k), inner))
 
     # functions
     else:
-        Dx = A.gen()
-
-        if inner:
-            x = A(inner)
-            d = A(inner.derivative())
-        else:
-            x = A.base_ring().gen()
-            d = 1  # x.derivative()
-
-        # sin
-        if isinstance(f, sage.functions.trig.Function_sin):
-            return A(Dx**2 + d**2)
-        # cos
-        elif isinstance(f, sage.functions.trig.Function_cos):
-            return A(Dx**2 + d**2)
-        # tan
-        elif isinstance(f, sage.functions.trig.Function_tan):
-            raise TypeError("Tan is not D-finite")
-        # arcsin
-        elif isinstance(f, sage.functions.trig.Function_arcsin):
-            return A((1-x**2)*Dx**2 - d*x*Dx)
-        # arccos
-        elif isinstance(f, sage.functions.trig.Function_arccos):
-            return A((1-x**2)*Dx**2 - d*x*Dx)
-        # arctan
-        elif isinstance(f, sage.functions.trig.Function_arctan):
-            return A((x**2+1)*Dx**2 + d*2*x*Dx)
-        # sinh
-        elif isinstance(f, sage.functions.hyperbolic.Function_sinh):
-            return A(Dx**2 - d**2)
-        # cosh
-        elif isinstance(f, sage.functions.hyperbolic.Function_cosh):
-            return A(Dx**2 - d**2)
-        # arcsinh
-        elif isinstance(f, sage.functions.hyperbolic.Function_arcsinh):
-            return A((1+x**2)*Dx**2 + d*x*Dx)
-        # arccosh
-        elif isinstance(f, sage.functions.hyperbolic.Function_arccosh):
-            raise TypeError("ArcCosh is not D-finite")
-        # arctanh
-        elif isinstance(f, sage.functions.hyperbolic.Function_arctanh):
-            return A((1-x**2)*Dx**2 - 2*d*x*Dx)
-        # exp
-        elif isinstance(f, sage.functions.log.Function_exp):
-            return A(Dx - d)
-        # log
-        elif isinstance(f, sage.functions.log.Function_log1):
-            return A(x*Dx**2 + d*Dx)
-        # sqrt
-        elif f == pow:
-            return A(-2*x*Dx + d)
-        # airy_ai
-        elif isinstance(f, sage.functions.airy.FunctionAiryAiSimple):
-            return A(Dx**2 - d**2*x)
-        # airy_ai_prime
-        elif isinstance(f, sage.functions.airy.FunctionAiryAiPrime):
-            return A(x*Dx**2 - d*Dx - d**2*x**2)
-        # airy_bi
-        elif isinstance(f, sage.functions.airy.FunctionAiryBiSimple):
-            return A(Dx**2 - d**2*x)
-        # airy_bi_prime
-        elif isinstance(f, sage.functions.airy.FunctionAiryBiPrime):
-            return A(x*Dx**2 - d*Dx - (d*x)**2)
-        # arccsc
-        elif isinstance(f, sage.functions.trig.Function_arccsc):
-            return A(x*(1-x**2)*Dx**2 - (2*x**2-1)*d*Dx)
-        # arccsch
-        elif isinstance(f, sage.functions.hyperbolic.Function_arccsch):
-            return A(x*(x**2+1)*Dx**2 + (2*x**2+1)*d*Dx)
-        # arcsec
-        elif isinstance(f, sage.functions.trig.Function_arcsec):
-            return A(x*(1-x**2)*Dx**2 - (2*x**2-1)*d*Dx)
-        # bessel_I
-        elif isinstance(f, sage.functions.bessel.Function_Bessel_I):
-            return A(x**2*Dx**2 + d*x*Dx - d**2*(x**2 + k**2))
-        # bessel_J
-        elif isinstance(f, sage.functions.bessel.Function_Bessel_J):
-            return A(x**2*Dx**2 + d*x*Dx + d**2*(x**2 - k**2))
-        # bessel_Y
-        elif isinstance(f, sage.functions.bessel.Function_Bessel_Y):
-            return A(x**2*Dx**2 + d*x*Dx + d**2*(x**2 - k**2))
-        # bessel_K
-        elif isinstance(f, sage.functions.bessel.Function_Bessel_K):
-            return A(x**2*Dx**2 + d*x*Dx - d**2*(x**2 + k**2))
-        # sherical_bessel_Jzz
-        elif isinstance(f, sage.functions.bessel.SphericalBesselJ):
-            return A(x**2*Dx**2 + 2*d*x*Dx + d**2*(x**2 - k*(k+1)))
-        # erf (error function)
-        elif isinstance(f, sage.functions.error.Function_erf):
-            return A(Dx**2 + 2*d*x*Dx)
-        # erfc (complementary error function)
-        elif isinstance(f, sage.functions.error.Function_erfc):
-            return A(Dx**2 + 2*d*x*Dx)
-        # erfi (imaginary error function)
-        elif isinstance(f, sage.functions.error.Function_erfi):
-            return A(Dx**2 - 2*d*x*Dx)
-        # dilog
-        elif isinstance(f, sage.functions.log.Function_dilog):
-            return A(x*(1-x)*Dx**3 + d*(2-3*x)*Dx**2 - d**2*Dx)
-        # exp_integral_e
-        elif isinstance(f, sage.functions.exp_integral.Function_exp_integral_e):
-            return A(x*Dx**2 + d*(x-k+2)*Dx + d**2*(1-k))
-        # exp_integral_ei (Ei)
-        elif isinstance(f, sage.functions.exp_integral.Function_exp_integral):
-            return A(x*Dx**3 + 2*d*Dx**2 - d**2*x*Dx)
-        # sin_integral
-        elif isinstance(f, sage.functions.exp_integral.Function_sin_integral):
-            return A(x*Dx**3 + 2*d*Dx**2 + d**2*x*Dx)
-        # cos_integral
-        elif isinstance(f, sage.functions.exp_integral.Function_cos_integral):
-            return A(x*Dx**3 + 2*d*Dx**2 + d**2*x*Dx)
-        # sinh_integral
-        elif isinstance(f, sage.functions.exp_integral.Function_sinh_integral):
-            return A(x*Dx**3 + 2*d*Dx**2 - d**2*x*Dx)
-        # cosh_integral
-        elif isinstance(f, sage.functions.exp_integral.Function_sinh_integral):
-            return A(x*Dx**3 + 2*d*Dx**2 - d**2*x*Dx)
-        # elliptic_ec (complete elliptic integral of second kind)
-        # -> problems with computing the derivative
-        elif isinstance(f, sage.functions.special.EllipticEC):
-            return A((1-x)*x*Dx**2 + d*(1-x)*Dx + d**2*QQ((1, 4)))
-        # elliptic_kc (complete elliptic integral of first kind)
-        # -> problems with computing the derivative
-        elif isinstance(f, sage.functions.special.EllipticKC):
-            return A((1-x)*x*Dx**2 + d*(1-2*x)*Dx - d**2*QQ((1, 4)))
-        else:
+        build = _builder(_FUNCTIONS, cls)
+        if build is None:
             raise NotImplementedError
+        x, d = _inner_data(R, inner)
+        return A(build(x, d, R(k)))
+
+
+def _binomial(n, k, inner):
+    # (k choose n) - k fixed, n variable
+    if k in QQ:
+        return [n-k, n+1]
+    # (a*n+b choose c*n+d) - a,b,c,d fixed, n variable
+    else:
+        f1 = prod(inner+i for i in range(1, inner[1]+1))
+        f2 = prod(k+i for i in range(1, k[1]+1))
+        f3 = prod(inner - k + i for i in range(1, inner[1]-k[1]+1))
+    return [-f1, f2*f3]
+
+
+def _not_dfinite(name):
+    def build(x, d, k):
+        raise TypeError(name + " is not D-finite")
+    return build
+
+
+# The annihilators in the database, as triples (module, name of the class of the symbolic
+# function, builder). The builders return the list of coefficients of the operator, which
+# symbolic_database converts to an element of A in a single step. For sequences, the builder
+# is called with the arguments n, k, inner, for functions with the arguments x, d, k as
+# prepared in symbolic_database. The tables are turned into dictionaries indexed by class by
+# _builder.
+
+_SEQUENCES = [
+    # factorial
+    (sage.functions.other, "Function_factorial",
+     lambda n, k, inner: [-(n+1), 1]),
+    # harmonic_number
+    (sage.functions.log, "Function_harmonic_number_generalized",
+     lambda n, k, inner: [n+1, -(2*n+3), n+2]),
+    # binomial
+    (sage.functions.other, "Function_binomial", _binomial),
+]
+
+_FUNCTIONS = [
+    # sin
+    (sage.functions.trig, "Function_sin", lambda x, d, k: [d**2, 0, 1]),
+    # cos
+    (sage.functions.trig, "Function_cos", lambda x, d, k: [d**2, 0, 1]),
+    # tan
+    (sage.functions.trig, "Function_tan", _not_dfinite("Tan")),
+    # arcsin
+    (sage.functions.trig, "Function_arcsin", lambda x, d, k: [0, -d*x, 1-x**2]),
+    # arccos
+    (sage.functions.trig, "Function_arccos", lambda x, d, k: [0, -d*x, 1-x**2]),
+    # arctan
+    (sage.functions.trig, "Function_arctan", lambda x, d, k: [0, d*2*x, x**2+1]),
+    # sinh
+    (sage.functions.hyperbolic, "Function_sinh", lambda x, d, k: [-d**2, 0, 1]),
+    # cosh
+    (sage.functions.hyperbolic, "Function_cosh", lambda x, d, k: [-d**2, 0, 1]),
+    # arcsinh
+    (sage.functions.hyperbolic, "Function_arcsinh", lambda x, d, k: [0, d*x, 1+x**2]),
+    # arccosh
+    (sage.functions.hyperbolic, "Function_arccosh", _not_dfinite("ArcCosh")),
+    # arctanh
+    (sage.functions.hyperbolic, "Function_arctanh", lambda x, d, k: [0, -2*d*x, 1-x**2]),
+    # exp
+    (sage.functions.log, "Function_exp", lambda x, d, k: [-d, 1]),
+    # log
+    (sage.functions.log, "Function_log1", lambda x, d, k: [0, d, x]),
+    # airy_ai
+    (sage.functions.airy, "FunctionAiryAiSimple", lambda x, d, k: [-d**2*x, 0, 1]),
+    # airy_ai_prime
+    (sage.functions.airy, "FunctionAiryAiPrime", lambda x, d, k: [-d**2*x**2, -d, x]),
+    # airy_bi
+    (sage.functions.airy, "FunctionAiryBiSimple", lambda x, d, k: [-d**2*x, 0, 1]),
+    # airy_bi_prime
+    (sage.functions.airy, "FunctionAiryBiPrime", lambda x, d, k: [-(d*x)**2, -d, x]),
+    # arccsc
+    (sage.functions.trig, "Function_arccsc", lambda x, d, k: [0, -(2*x**2-1)*d, x*(1-x**2)]),
+    # arccsch
+    (sage.functions.hyperbolic, "Function_arccsch", lambda x, d, k: [0, (2*x**2+1)*d, x*(x**2+1)]),
+    # arcsec
+    (sage.functions.trig, "Function_arcsec", lambda x, d, k: [0, -(2*x**2-1)*d, x*(1-x**2)]),
+    # bessel_I
+    (sage.functions.bessel, "Function_Bessel_I", lambda x, d, k: [-d**2*(x**2 + k**2), d*x, x**2]),
+    # bessel_J
+    (sage.functions.bessel, "Function_Bessel_J", lambda x, d, k: [d**2*(x**2 - k**2), d*x, x**2]),
+    # bessel_Y
+    (sage.functions.bessel, "Function_Bessel_Y", lambda x, d, k: [d**2*(x**2 - k**2), d*x, x**2]),
+    # bessel_K
+    (sage.functions.bessel, "Function_Bessel_K", lambda x, d, k: [-d**2*(x**2 + k**2), d*x, x**2]),
+    # sherical_bessel_J
+    (sage.functions.bessel, "SphericalBesselJ", lambda x, d, k: [d**2*(x**2 - k*(k+1)), 2*d*x, x**2]),
+    # erf (error function)
+    (sage.functions.error, "Function_erf", lambda x, d, k: [0, 2*d*x, 1]),
+    # erfc (complementary error function)
+    (sage.functions.error, "Function_erfc", lambda x, d, k: [0, 2*d*x, 1]),
+    # erfi (imaginary error function)
+    (sage.functions.error, "Function_erfi", lambda x, d, k: [0, -2*d*x, 1]),
+    # dilog
+    (sage.functions.log, "Function_dilog", lambda x, d, k: [0, -d**2, d*(2-3*x), x*(1-x)]),
+    # exp_integral_e
+    (sage.functions.exp_integral, "Function_exp_integral_e", lambda x, d, k: [d**2*(1-k), d*(x-k+2), x]),
+    # exp_integral_ei (Ei)
+    (sage.functions.exp_integral, "Function_exp_integral", lambda x, d, k: [0, -d**2*x, 2*d, x]),
+    # sin_integral
+    (sage.functions.exp_integral, "Function_sin_integral", lambda x, d, k: [0, d**2*x, 2*d, x]),
+    # cos_integral
+    (sage.functions.exp_integral, "Function_cos_integral", lambda x, d, k: [0, d**2*x, 2*d, x]),
+    # sinh_integral
+    (sage.functions.exp_integral, "Function_sinh_integral", lambda x, d, k: [0, -d**2*x, 2*d, x]),
+    # cosh_integral
+    (sage.functions.exp_integral, "Function_cosh_integral", lambda x, d, k: [0, -d**2*x, 2*d, x]),
+    # elliptic_ec (complete elliptic integral of second kind)
+    # -> problems with computing the derivative
+    (sage.functions.special, "EllipticEC", lambda x, d, k: [d**2*QQ((1, 4)), d*(1-x), (1-x)*x]),
+    # elliptic_kc (complete elliptic integral of first kind)
+    # -> problems with computing the derivative
+    (sage.functions.special, "EllipticKC", lambda x, d, k: [-d**2*QQ((1, 4)), d*(1-2*x), (1-x)*x]),
+]
+
+_dispatch = {}
+
+
+def _builder(table, t):
+    r"""
+    Returns the builder for symbolic functions of class ``t`` from ``table`` (one of ``_SEQUENCES``
+    and ``_FUNCTIONS``), or ``None`` if there is none.
+
+    The lookup is a single dictionary access per call. The dictionary for ``table`` is created
+    on first use; classes which do not exist in the running version of Sage are skipped. Classes
+    which are not in the table are resolved through their base classes once and then remembered.
+    """
+    try:
+        cache = _dispatch[id(table)]
+    except KeyError:
+        cache = _dispatch[id(table)] = {}
+        for module, name, build in table:
+            cls = getattr(module, name, None)
+            if cls is not None:
+                cache.setdefault(cls, build)
+    try:
+        return cache[t]
+    except KeyError:
+        pass
+    build = None
+    for cls in t.__mro__[1:]:
+        if cls in cache:
+            build = cache[cls]
+            break
+    cache[t] = build
+    return build
@@ -323,6 +323,8 @@ class Sigma_class:
             return self.__R.one()
         elif n == 1:
             return p
+        elif self.__is_identity:
+            return p**n if n > 0 else ~(p**(-n))
         elif n > 1:
             q = p
             out = p
@@ -1668,6 +1670,35 @@ class OreAlgebra_generic(UniqueRepresentation, Parent):
     def _an_element_(self, *args, **kwds):
         return self._element_constructor_(self.associated_commutative_algebra().an_element(*args, **kwds))
 
+    @cached_method
+    def _hot_cache(self):
+        r"""
+        Returns a dictionary with data about the first generator of this algebra
+        which is needed over and over again in the arithmetic of its elements.
+
+        The entries are ``'sigma'``, ``'delta'``, ``'gen'``, ``'zero'`` (of the base ring),
+        ``'base_is_field'``, ``'assoc'`` (the associated commutative algebra), and the flags
+        ``'sigma_is_identity'`` and ``'delta_is_zero'``.
+
+        EXAMPLES::
+
+            sage: from ore_algebra import OreAlgebra
+            sage: A.<Dx> = OreAlgebra(QQ['x'], 'Dx')
+            sage: h = A._hot_cache()
+            sage: h['gen'] == Dx, h['base_is_field'], h['sigma_is_identity'], h['delta_is_zero']
+            (True, False, True, False)
+        """
+        sigma = self.sigma()
+        delta = self.delta()
+        return {'sigma': sigma,
+                'delta': delta,
+                'gen': self.gen(),
+                'zero': self.base_ring().zero(),
+                'base_is_field': self.base_ring().is_field(),
+                'assoc': self.associated_commutative_algebra(),
+                'sigma_is_identity': sigma.is_identity(),
+                'delta_is_zero': delta.is_zero()}
+
     # generation of related parent objects
 
     def associated_commutative_algebra(self):
@@ -19,16 +19,27 @@ Operators
 from functools import reduce
 
 from sage.structure.element import RingElement, canonical_coercion
-from sage.structure.richcmp import richcmp
-from sage.arith.all import gcd, lcm
+from sage.structure.richcmp import richcmp, op_EQ, op_NE
+from sage.arith.all import gcd, lcm, previous_prime, xgcd
+from sage.rings.finite_rings.all import GF
+from sage.rings.fraction_field import is_FractionField
 from sage.rings.infinity import infinity
+from sage.rings.integer_ring import ZZ
+from sage.rings.polynomial.polynomial_ring import is_PolynomialRing
+from sage.rings.rational_field import QQ
 from sage.rings.power_series_ring_element import PowerSeries
 from sage.rings.laurent_series_ring import LaurentSeriesRing
 from sage.rings.laurent_series_ring_element import LaurentSeries
 from sage.functions.generalized import sign
+from sage.misc.cachefunc import cached_method
+from sage.parallel.decorate import parallel
 
 from .generalized_series import ContinuousGeneralizedSeries, GeneralizedSeriesMonoid
 
+# word size prime for the modular tests of the helper functions below
+_WORD_PRIME = previous_prime(2**23)
+_WORD_PRIME_FIELD = GF(_WORD_PRIME)
+
 class OreOperator(RingElement):
     """
     An Ore operator. This is an abstract class whose instances represent elements of ``OreAlgebra``.
@@ -451,12 +462,21 @@ class OreOperator(RingElement):
                 return coeffs[0]
             
             try:
+                if is_PolynomialRing(R) and R.base_ring() in (ZZ, QQ) and _coprime_mod_p(coeffs):
+                    # the content is a constant
+                    if R.base_ring() is QQ:
+                        return R.one()
+                    return R(gcd([p.content() for p in coeffs]))
+
                 a = sum(R(29*i+13)*coeffs[i] for i in range(len(coeffs)))
                 b = sum(R(31*i+17)*coeffs[i] for i in range(len(coeffs)))
                 try:
                     c = a.gcd(b)
                 except:
                     c = R.zero()
+                if c.is_unit():
+                    # the content divides c, so it is trivial as well
+                    return R.one()
                 if not proof and not c.is_zero() and \
                    sum(len(p.coefficients()) for p in coeffs) > 1000: # no shortcut for small operators
                     return c
@@ -469,7 +489,12 @@ class OreOperator(RingElement):
                     # move polynomials with fewer terms to front
                     coeffs.sort(key=lambda p: len(p.exponents()))
 
-                return gcd(coeffs)
+                g = coeffs[0]
+                for c in coeffs[1:]:
+                    g = g.gcd(c)
+                    if g.is_unit():
+                        return R.one()
+                return g
             except:
                 return R.one()
 
@@ -695,22 +720,39 @@ class UnivariateOreOperator(OreOperator):
             else:
                 R = f.parent()
                 
-        coeffs = self.coefficients(sparse=False)
+        exps = self._exponents()
+        if len(exps) == 1:
+            # c*D^n: apply the action n times and scale only once
+            Dif = f
+            for i in range(exps[0]):
+                Dif = D(Dif)
+            return R(self._nonzero_coefficients()[0])*Dif
+
+        coeffs = [R(c) for c in self.coefficients(sparse=False)]
         Dif = f
-        result = R(coeffs[0])*f
-        for i in range(1, self.order() + 1):
+        result = coeffs[0]*f
+        for i in range(1, len(coeffs)):
             Dif = D(Dif)
-            result += R(coeffs[i])*Dif
+            if coeffs[i]:
+                result += coeffs[i]*Dif
         
         return result
 
     # tests
 
-    def __nonzero__(self):
-        return bool(self._poly).__nonzero__()
+    def __bool__(self):
+        return bool(self._poly)
+
+    __nonzero__ = __bool__
 
     def _richcmp_(self, other, op):
-        return richcmp(self.polynomial(), other.polynomial(), op)
+        if op == op_EQ or op == op_NE:
+            # cheap tests before comparing all coefficients
+            if self._poly is other._poly:
+                return op == op_EQ
+            if self.order() != other.order():
+                return op == op_NE
+        return richcmp(self._poly, other._poly, op)
 
     def _is_atomic(self):
         return self._poly._is_atomic()
@@ -793,10 +835,10 @@ class UnivariateOreOperator(OreOperator):
     # arithmetic
 
     def _add_(self, right):
-        return self.parent()(self.polynomial() + right.polynomial())
+        return self.parent()(self._poly + right._poly)
     
     def _neg_(self):
-        return self.parent()(self.polynomial()._neg_())
+        return self.parent()(self._poly._neg_())
 
     def _mul_(self, right):
 
@@ -806,31 +848,50 @@ class UnivariateOreOperator(OreOperator):
             return right
 
         R = self.parent() # Ore algebra
-        sigma = R.sigma()
-        delta = R.delta()
-        D = R.associated_commutative_algebra().gen()
-
-        if sigma.is_identity():
-            def times_D(b):
-                return b*D + b.map_coefficients(delta)
-        elif delta.is_zero():
-            def times_D(b):
-                return b.map_coefficients(sigma)*D
+        zero = R._hot_cache()['zero']
+        times_D = _times_D_kernel(R)
+
+        A = self.list()
+        res = [zero]*(len(A) + right.order())
+
+        # As long as D^i * B is sparse, keep it as a dictionary of its nonzero
+        # coefficients, and switch to a dense list once it has filled in.
+        DiB = right.dict() # D^i * B, for i=0,1,2,...
+        sparse = len(DiB) < 0.3*(right.order() + 1)
+        if sparse:
+            times_D_sparse = _times_D_kernel(R, sparse=True)
         else:
-            def times_D(b):
-                return b.map_coefficients(sigma)*D + b.map_coefficients(delta)
-
-        DiB = right.polynomial() # D^i * B, for i=0,1,2,...
-        res = self[0]*DiB
-        for i in range(1, self.order() + 1):
-            DiB = times_D(DiB)
-            res += self[i]*DiB
+            DiB = right.list()
+
+        for i, a in enumerate(A):
+            if i > 0:
+                if sparse:
+                    DiB = times_D_sparse(DiB)
+                    sparse = len(DiB) < 0.3*(right.order() + i + 1)
+                    if not sparse:
+                        DiB = [DiB.get(j, zero) for j in range(right.order() + i + 1)]
+                else:
+                    DiB = times_D(DiB)
+            if not a.is_zero():
+                for j, c in (DiB.items() if sparse else enumerate(DiB)):
+                    res[j] += a*c
 
         return R(res)
 
     def _rmul_(self, left):
         return self.parent()([left*c for c in self])
 
+    def _left_mul_by_gen(self):
+        """
+        Returns ``D*self``, where ``D`` is the generator of the parent of ``self``.
+
+        This is equivalent to, but cheaper than, ``self.parent().gen()*self``.
+        """
+        if self.is_zero():
+            return self
+        R = self.parent()
+        return R(_times_D_kernel(R)(self.list()))
+
     def reduce(self, basis, normalize=False, cofactors=False, infolevel=0, coerce=True):
         ## compatibility method for multivariate case
 
@@ -850,51 +911,74 @@ class UnivariateOreOperator(OreOperator):
         return p.normalize() if normalize else p
     
     def quo_rem(self, other, fractionFree=False):
+        return self._quo_rem(other, fractionFree, True)
+
+    quo_rem.__doc__ = OreOperator.quo_rem.__doc__
+
+    def __mod__(self, other):
+        return self._quo_rem(other, False, False)
+
+    __mod__.__doc__ = OreOperator.__mod__.__doc__
 
+    def _quo_rem(self, other, fractionFree, quotient):
+        """
+        Does the work for ``quo_rem``. If ``quotient`` is ``False``, only the remainder
+        is returned, and the coefficients of the quotient are not collected.
+        """
         if other.is_zero(): 
             raise ZeroDivisionError("other must be nonzero")
 
         elif self.parent() is not other.parent():
             A, B = canonical_coercion(self, other)
-            return A.quo_rem(B, fractionFree=fractionFree)
+            return A._quo_rem(B, fractionFree, quotient)
         
         elif (self.order() < other.order()):
-            return (self.parent().zero(), self)
+            return (self.parent().zero(), self) if quotient else self
 
         p = self
         q = other
         R = self.parent()
-        if fractionFree is False and not R.base_ring().is_field():
+        if fractionFree is False and not R._hot_cache()['base_is_field']:
             R = R.change_ring(R.base_ring().fraction_field())
             p = R(p)
             q = R(q)
-        sigma = R.sigma()
-        D = R.gen()
-        orddiff = p.order() - q.order()
-        cfquo = R.one()
-        quo = R.zero()
-
-        qlcs = [q.leading_coefficient()]
+        zero = R._hot_cache()['zero']
+        times_D = _times_D_kernel(R)
+        n = q.order()
+        orddiff = p.order() - n
+
+        # coefficient lists of D^k*q for k=0,...,orddiff; the last entry of Dq[k]
+        # is the k-fold sigma shift of the leading coefficient of q.
+        Dq = [q.list()]
         for i in range(orddiff):
-            qlcs.append(sigma(qlcs[-1]))
+            Dq.append(times_D(Dq[-1]))
 
         if fractionFree:
-            op = lambda x,y:x//y
+            op = lambda x,i:x//Dq[i][-1]
         else:
-            op = lambda x,y:x/y
-        while(orddiff >= 0):
-            currentOrder=p.order()
-            cfquo = op(p.leading_coefficient(),qlcs[orddiff]) * D**(orddiff)
-            quo = quo+cfquo
-            p = p - cfquo*q
-            if p.order()==currentOrder:
-                p = self
-                q = other
-                op = lambda x,y:x/y
-            orddiff = p.order() - q.order()
-        return (quo,p)
-
-    quo_rem.__doc__ = OreOperator.quo_rem.__doc__
+            # the base ring is a field here; invert each divisor only once
+            qlcs_inv = [~Dq[i][-1] for i in range(orddiff + 1)]
+            op = lambda x,i:x*qlcs_inv[i]
+
+        # eliminate the leading terms of p in place
+        p = p.list()
+        quo = [zero]*(orddiff + 1) if quotient else None
+        while orddiff >= 0:
+            Dqk = Dq[orddiff]
+            c = op(p[-1], orddiff)
+            if fractionFree and not (p[-1] - c*Dqk[-1]).is_zero():
+                # inexact division, redo the computation over the fraction field
+                return self._quo_rem(other, False, quotient)
+            if quotient:
+                quo[orddiff] = c
+            p.pop()
+            for j in range(len(p)):
+                p[j] -= c*Dqk[j]
+            while p and p[-1].is_zero():
+                p.pop()
+            orddiff = len(p) - 1 - n
+
+        return (R(quo), R(p)) if quotient else R(p)
 
     def pseudo_quo_rem(self, other):
 
@@ -914,8 +998,10 @@ class UnivariateOreOperator(OreOperator):
         D = self.parent().gen()
         sigma = self.parent().sigma()
         sigma_lc = [q.leading_coefficient()]
+        D_powers = [self.parent().one()]
         for i in range(p.order() - q.order()):
             sigma_lc.append(sigma(sigma_lc[-1]))
+            D_powers.append(D_powers[-1]*D)
 
         den, quo, rem = p.base_ring().one(), p.parent().zero(), p
 
@@ -932,7 +1018,7 @@ class UnivariateOreOperator(OreOperator):
                 a = sigma_lc[rem.order() - ord]
                 b = rem.leading_coefficient()
 
-            cfquo = b*D**(rem.order() - ord)
+            cfquo = b*D_powers[rem.order() - ord]
             den = a*den
             quo = a*quo + cfquo
             rem = a*rem - cfquo*other
@@ -952,6 +1038,10 @@ class UnivariateOreOperator(OreOperator):
         - ``other`` -- one or more operators which together with ``self`` can be coerced to a common parent.
         - ``prs`` (default: "essential") -- pseudo remainder sequence to be used. Possible values are
           "essential", "primitive", "classic", "subresultant", "monic".
+          If no ``prs`` is given and the base ring is `ZZ[x]` or `QQ[x]` or the fraction field
+          of one of these, the gcrd is computed from its images modulo several primes instead.
+        - ``ncpus`` (default: 1) -- number of processors among which the computation of the
+          modular images is distributed.
         
         OUTPUT:
 
@@ -971,6 +1061,15 @@ class UnivariateOreOperator(OreOperator):
            sage: S*L1 + T*L2 == L3
            True
 
+           sage: A.<Dx> = OreAlgebra(QQ['x'], 'Dx')
+           sage: x = A.base_ring().gen()
+           sage: G = x*Dx^2 + (x+1)*Dx - 2
+           sage: L1, L2 = (Dx^2 + x)*G, ((x+1)*Dx - 1)*G
+           sage: L1.gcrd(L2) == G.normalize()
+           True
+           sage: L1.gcrd(L2) == L1.gcrd(L2, prs="essential")
+           True
+
         """
 
         if len(other) > 1:
@@ -992,6 +1091,12 @@ class UnivariateOreOperator(OreOperator):
         prs = kwargs["prs"] if "prs" in kwargs else None
         infolevel = kwargs["infolevel"] if "infolevel" in kwargs else 0
 
+        if prs is None:
+            ncpus = kwargs["ncpus"] if "ncpus" in kwargs else 1
+            g = self._gcrd_modular(other, infolevel=infolevel, ncpus=ncpus)
+            if g is not None:
+                return g
+
         r = (self,other)
         if (r[0].order()<r[1].order()):
             r=(other,self)
@@ -1006,14 +1111,24 @@ class UnivariateOreOperator(OreOperator):
         try:
             prs = prslist[prs]
         except:
-            if self.base_ring().is_field():
+            K = self.base_ring()
+            if not K.is_field():
+                prs = __essentialPRS__
+            elif not is_FractionField(K) or _classic_prs_is_cheap(*r):
                 prs = __classicPRS__
             else:
-                prs = __essentialPRS__
+                # avoid the growth of rational function coefficients by running a
+                # fraction free prs on the numerators
+                A, B = r[0].numerator(), r[1].numerator()
+                if A.parent() is B.parent() and not A.parent().base_ring().is_field():
+                    r = (A, B)
+                    prs = __essentialPRS__
+                else:
+                    prs = __classicPRS__
 
         additional = []
-        while not r[1].is_zero():
-            (r2,q,alpha,beta,correct)=prs(r,additional)
+        while r[1]._poly:
+            (r2,q,alpha,beta,correct)=prs(r,additional,False)
             if not correct:
                 if infolevel>0:
                     print("switching to primitive PRS")
@@ -1024,7 +1139,149 @@ class UnivariateOreOperator(OreOperator):
                     print(r[0].order())
         r=r[0]
 
-        return r.normalize()
+        return self.parent()(r.normalize())
+
+    def _gcrd_modular(self, other, infolevel=0, ncpus=1):
+        """
+        gcrd algorithm based on homomorphic images modulo word size primes.
+
+        Applies if the base ring is `ZZ[x]` or `QQ[x]` or the fraction field of one of these,
+        and returns ``None`` otherwise. The gcrds of the images of ``self`` and ``other`` are
+        combined by Chinese remaindering and rational reconstruction. Once the reconstruction
+        stabilizes, the candidate is checked by exact division, so the result is always correct.
+        If ``ncpus`` is greater than 1, that many images are computed in parallel.
+        Primes for which the image cannot be computed are skipped, and if there are too many
+        of them, ``None`` is returned as well, so that ``gcrd`` falls back to a PRS.
+
+        see docstring of gcrd for further information.
+
+        TESTS:
+
+        Primes dividing the leading coefficient of the leading coefficient of an operator are
+        discarded, even if the orders of the images do not drop::
+
+           sage: from ore_algebra import *
+           sage: R.<x> = ZZ[]
+           sage: A.<Dx> = OreAlgebra(R, 'Dx')
+           sage: G = (8388593*x + 1)*Dx + x # 8388593 is the first prime tried
+           sage: (Dx*G).gcrd((Dx + x)*G) == G.normalize()
+           True
+
+        The images can be computed in parallel::
+
+           sage: G = x*Dx^2 + (x + 1)*Dx - 2
+           sage: L1, L2 = (Dx^2 + x)*G, ((x + 1)*Dx - 1)*G
+           sage: L1.gcrd(L2, ncpus=2) == L1.gcrd(L2)
+           True
+        """
+        A = self.numerator()
+        B = other.numerator()
+        Alg = A.parent()
+        R = Alg.base_ring()
+        if B.parent() is not Alg or not is_PolynomialRing(R) or R.base_ring() not in (ZZ, QQ):
+            return None
+
+        def image(p):
+            # returns (order, degree, coefficients) of the monic gcrd mod p, as plain
+            # integers so that they can be passed between processes, or None if p
+            # is not admissible or the computation modulo p fails.
+            try:
+                return _image(p)
+            except Exception:
+                return None
+
+        def _image(p):
+            Rp = R.change_ring(GF(p))
+            Algp = Alg.change_ring(Rp)
+            Ap = Algp([Rp(c) for c in A])
+            Bp = Algp([Rp(c) for c in B])
+            # the images must keep the orders and the degrees of the leading coefficients,
+            # otherwise they are not normalized consistently
+            if Ap.order() < A.order() or Bp.order() < B.order():
+                return None
+            if (Ap.leading_coefficient().degree() < A.leading_coefficient().degree()
+                    or Bp.leading_coefficient().degree() < B.leading_coefficient().degree()):
+                return None
+            Gp = Algp(Ap.gcrd(Bp).normalize())
+            k = Gp.order()
+            d = max(c.degree() for c in Gp)
+            return (k, d, [ZZ(c[j]) for c in Gp for j in range(d + 1)])
+
+        if ncpus > 1:
+            @parallel(ncpus=ncpus)
+            def forked_image(p):
+                return image(p)
+
+        # Modulo a prime p for which the leading coefficients do not vanish, the
+        # gcrd has at least the order of the true gcrd. If the orders agree, the
+        # image gcrd is the primitive part of the image of the true gcrd, so its
+        # degree is at most the degree of the true primitive gcrd and can only
+        # drop when p divides a coefficient of the content.
+        # Primes for which the image has higher order or lower degree are unlucky.
+        best = None # (order, degree) of the images collected so far
+        V, M, previous = None, None, None
+        bad = 0 # number of primes for which no image could be computed
+        p = 2**23
+
+        while True:
+
+            primes = []
+            while len(primes) < ncpus:
+                p = previous_prime(p)
+                primes.append(p)
+            if ncpus == 1:
+                images = [(p, image(p))]
+            else:
+                images = sorted((u[0][0], v) for u, v in forked_image(primes)) # MAIN WORK, DONE IN PARALLEL
+
+            for p, img in images:
+
+                if not isinstance(img, tuple):
+                    bad += 1
+                    if bad > 20:
+                        # something is wrong with the modular images, e.g. sigma
+                        # or delta do not reduce properly; let gcrd use a prs
+                        if infolevel > 0:
+                            print("too many inadmissible moduli; switching to a prs")
+                        return None
+                    continue
+                k, d, Vp = img
+                if k == 0:
+                    return self.parent().one()
+
+                if best is None or k < best[0] or (k == best[0] and d > best[1]):
+                    # initialization, or all previous primes were unlucky
+                    best = (k, d)
+                    V, M, previous = Vp, p, None
+                    continue
+                elif (k, d) != best:
+                    if infolevel > 0:
+                        print("unlucky modulus " + str(p) + " discarded")
+                    continue
+
+                # combine the new image with the known partial solution
+                (_, M0, p0) = xgcd(p, M)
+                M0, p0 = M0*p, p0*M
+                M *= p
+                V = [(u*M0 + v*p0) % M for u, v in zip(V, Vp)]
+
+                # rational reconstruction and check for termination
+                try:
+                    rat = [ZZ(u).rational_reconstruction(M) for u in V]
+                except (ArithmeticError, ValueError):
+                    continue
+                if rat != previous:
+                    previous = rat
+                    continue
+
+                den = lcm([c.denominator() for c in rat])
+                G = Alg([R([den*rat[i*(d + 1) + j] for j in range(d + 1)]) for i in range(k + 1)])
+                if (A % G).is_zero() and (B % G).is_zero():
+                    return self.parent()(G).normalize()
+                if infolevel > 0:
+                    print("reconstructed candidate is not a common right divisor; continuing")
+
+            p = min(primes)
 
     def xgcrd(self, other, **kwargs):
         """
@@ -1110,7 +1367,7 @@ class UnivariateOreOperator(OreOperator):
 
         additional = []
 
-        while not r[1].is_zero():  
+        while r[1]._poly:  
             (r2, q, alpha, beta, correct) = prs(r, additional)
             if not correct:
                 if infolevel>0:
@@ -1227,37 +1484,56 @@ class UnivariateOreOperator(OreOperator):
 
         solver = kwargs["solver"] if "solver" in kwargs else None
 
+        # work in the algebra over the polynomial ring (if possible) and convert
+        # back to the parent of self only at the very end
         A = self.numerator()
-        r = A.order()
         B = other.numerator()
+        if A.parent() is not B.parent():
+            A, B = canonical_coercion(A, B)
+        r = A.order()
         s = B.order()
-        D = A.parent().gen()
 
         t = max(r, s) # current hypothesis for the order of the lclm
 
-        rowsA = [A]
+        # the rows D*row inherit the content of row; dividing it out keeps the
+        # entries of the matrix small. A combination of the primitive rows is
+        # still a left multiple of A (resp. B), so the solution can be used as is.
+        nextrow = lambda row: row._left_mul_by_gen().primitive_part()
+
+        rowsA = [A.primitive_part()]
         for i in range(t - r):
-            rowsA.append(D*rowsA[-1])
-        rowsB = [B]
+            rowsA.append(nextrow(rowsA[-1]))
+        rowsB = [B.primitive_part()]
         for i in range(t - s):
-            rowsB.append(D*rowsB[-1])
+            rowsB.append(nextrow(rowsB[-1]))
 
         from sage.matrix.constructor import Matrix
         if solver is None:
             solver = A.parent()._solver()
 
-        sys = Matrix([p.coefficients(sparse=False,padd=t) for p in rowsA + rowsB]).transpose()
+        K = A.parent().base_ring()
+        sys = Matrix(K, [p.coefficients(sparse=False,padd=t) for p in rowsA + rowsB]).transpose()
+        colsA = list(range(len(rowsA))) # indices of the columns of sys which come from rowsA
         sol = solver(sys)
 
         while len(sol) == 0:
             t += 1
-            rowsA.append(D*rowsA[-1])
-            rowsB.append(D*rowsB[-1])
-            sys = Matrix([p.coefficients(sparse=False,padd=t) for p in rowsA + rowsB]).transpose()
+            rowsA.append(nextrow(rowsA[-1]))
+            rowsB.append(nextrow(rowsB[-1]))
+            # the old columns only get a zero entry for the new power of D,
+            # so extend the matrix instead of rebuilding it
+            colsA.append(sys.ncols())
+            new = Matrix(K, [p.coefficients(sparse=False,padd=t) for p in (rowsA[-1], rowsB[-1])]).transpose()
+            sys = sys.stack(sys.new_matrix(1, sys.ncols())).augment(new)
             sol = solver(sys)
 
-        U = A.parent()(list(sol[0])[:t+1-r])
-        return self.parent()((U*A).normalize())
+        # U*A is the combination of the (primitive) rows with the coefficients of U
+        L = A.parent().zero()
+        for i, row in zip(colsA, rowsA):
+            c = sol[0][i]
+            if not c.is_zero():
+                L += c*row
+        return self.parent()(L.normalize())
 
     def _lclm_guess(self, other, **kwargs):
         """
@@ -1487,11 +1763,13 @@ class UnivariateOreOperator(OreOperator):
         if not isinstance(other, UnivariateOreOperator):
             raise TypeError("unexpected argument in symmetric_product")
 
-        if self.parent() != other.parent():
+        if self.parent() is not other.parent():
             A, B = canonical_coercion(self, other)
             return A.symmetric_product(B, solver=solver)
 
-        R = self.base_ring().fraction_field()
+        R = self.base_ring()
+        if not R.is_field():
+            R = R.fraction_field()
         zero = R.zero()
         one = R.one()
         
@@ -1501,8 +1779,6 @@ class UnivariateOreOperator(OreOperator):
         b = B.order()
 
         Alg = A.parent()
-        sigma = Alg.sigma()
-        delta = Alg.delta()
 
         if A.is_zero() or B.is_zero():
             return A
@@ -1517,11 +1793,12 @@ class UnivariateOreOperator(OreOperator):
 
         if b == 1:
             
-            D = A.parent().gen()
-            D1 = D(R.one())
+            D = Alg.gen()
+            D1 = D(one)
+            if B[0] == -B[1]*D1:
+                # B annihilates the constants; avoid the division below
+                return A
             h = -B[0]/B[1] # B = D - h
-            if h == D1:
-                return A            
 
             # define g such that (D - h)(u) == 0 iff (D - g)(1/u) == 0.
             g = (D1 - pr[0] - pr[1]*h)/(pr[1] + pr[2]*h)
@@ -1532,17 +1809,17 @@ class UnivariateOreOperator(OreOperator):
             q = pr[0] + pr[1]*g
 
             # calculate L with L(u*v)=0 iff A(v)=0 and B(u)=0 using A(1/u * u*v) = 0
+            # i.e., L = sum(coeffs[i]*(p*D + q)^i), evaluated by Horner's rule
             coeffs = A.coefficients(sparse=False)
-            L = coeffs[0]
-            Dk = A.parent().one()
-            for i in range(1, A.order() + 1):
-                #Dk = Dk.map_coefficients(sigma_u)*D + Dk.map_coefficients(delta_u) [[buggy??]]
-                Dk = (p*D + q)*Dk
+            pDq = p*D + q
+            L = Alg(coeffs[a])
+            for i in range(a - 1, -1, -1):
+                L = L*pDq
                 c = coeffs[i]
                 if not c.is_zero():
-                    L += c*Dk
+                    L += c
             
-            return A.parent()(L).normalize()
+            return L.normalize()
 
         # general case via linear algebra
 
@@ -1552,42 +1829,45 @@ class UnivariateOreOperator(OreOperator):
         if solver is None:
             solver = Alg._solver()
 
-        # Dkuv[i][j] is the coefficient of D^i(u)*D^j(v) in the normal form of D^k(u*v) 
-        Dkuv = [[zero for i in range(b + 1)] for j in range(a + 1)]
-        Dkuv[0][0] = one
+        push = _push_kernel(Alg)
+
+        # Dkuv[i*m + j] is the coefficient of D^i(u)*D^j(v) in the normal form of D^k(u*v),
+        # stored in a flat list with rows of length m = b + 1
+        m = b + 1
+        Dkuv = [zero]*((a + 1)*m)
+        Dkuv[0] = one
+        # flat indices of the cells (i, j) with i < a and j < b, as visited by the push step
+        cells = [i*m + j for i in range(a - 1, -1, -1) for j in range(b - 1, -1, -1)]
         
-        mat = [[Dkuv[i][j] for i in range(a) for j in range(b)]]
+        mat = []
+        kernel = _IncrementalKernel(R)
 
-        from sage.matrix.constructor import Matrix
-        sol = solver(Matrix(mat).transpose())
+        while True:
 
-        while len(sol) == 0:
+            # solve, but only once the new row (possibly) depends on the previous ones
+            row = []
+            for i in range(0, a*m, m):
+                row.extend(Dkuv[i:i + b])
+            mat.append(row)
+            sol = kernel.solve(mat, solver)
+            if len(sol) > 0:
+                break
 
-            # push
-            for i in range(a - 1, -1, -1):
-                for j in range(b - 1, -1, -1):
-                    s = sigma(Dkuv[i][j])
-                    Dkuv[i + 1][j + 1] += s*pr[2]
-                    Dkuv[i][j + 1] += s*pr[1]
-                    Dkuv[i + 1][j] += s*pr[1]
-                    Dkuv[i][j] = delta(Dkuv[i][j]) + s*pr[0]
-
-            # reduce
-            for i in range(a + 1):
-                if not Dkuv[i][b] == zero:
-                    for j in range(b):
-                        Dkuv[i][j] += Bred[j]*Dkuv[i][b]
-                    Dkuv[i][b] = zero
+            push(Dkuv, cells, m)
 
-            for j in range(b): # not b + 1
-                if not Dkuv[a][j] == zero:
-                    for i in range(a):
-                        Dkuv[i][j] += Ared[i]*Dkuv[a][j]
-                    Dkuv[a][j] = zero
+            # reduce: add multiples of Bred to rows and of Ared to columns of Dkuv
+            for i in range(0, (a + 1)*m, m):
+                c = Dkuv[i + b]
+                if not c == zero:
+                    Dkuv[i:i + b] = [u + c*w for u, w in zip(Dkuv[i:i + b], Bred)]
+                    Dkuv[i + b] = zero
 
-            # solve
-            mat.append([Dkuv[i][j] for i in range(a) for j in range(b)])
-            sol = solver(Matrix(mat).transpose())
+            am = a*m
+            for j in range(b): # not b + 1
+                c = Dkuv[am + j]
+                if not c == zero:
+                    Dkuv[j:am:m] = [u + c*w for u, w in zip(Dkuv[j:am:m], Ared)]
+                    Dkuv[am + j] = zero
 
         L = A.parent()(list(sol[0]))
         return L
@@ -1614,9 +1894,15 @@ class UnivariateOreOperator(OreOperator):
            -x*Sx^3 + (x^3 + 2*x^2 + 3*x + 2)*Sx^2 + (2*x^3 + 2*x^2 + 4*x)*Sx - 8*x - 8
            sage: A.random_element().symmetric_power(0)
            Sx - 1
+
+        The result belongs to the parent of ``self`` if ``symmetric_product`` does::
+
+           sage: B.<Tx> = OreAlgebra(QQ['x'], 'Tx')
+           sage: (x*Tx - 1).symmetric_power(2).parent() is B
+           True
         
         """
-        if exp < 0:
+        if exp < 0 or exp not in ZZ:
             raise TypeError("unexpected exponent received in symmetric_power")
         elif exp == 0:
             D = self.parent().gen()
@@ -1624,14 +1910,23 @@ class UnivariateOreOperator(OreOperator):
             return D - R(D(R.one())) # annihilator of 1
         elif exp == 1:
             return self
-        elif exp % 2 == 1:
-            L = self.symmetric_power(exp - 1, solver=solver)
-            return L.symmetric_product(self, solver=solver)
-        elif exp % 2 == 0:
-            L = self.symmetric_power(exp/2, solver=solver)
-            return L.symmetric_product(L, solver=solver)
-        else:
-            raise TypeError("unexpected exponent received in symmetric_power")
+        elif (not self.base_ring().is_field()
+              and type(self).symmetric_product is UnivariateOreOperator.symmetric_product):
+            # all symmetric products live over the fraction field; convert only once.
+            # Subclasses overriding symmetric_product may convert back to their parent.
+            return self.change_ring(self.base_ring().fraction_field()).symmetric_power(exp, solver=solver)
+
+        # binary powering, from the least significant bit of exp upwards
+        exp = ZZ(exp)
+        L = None
+        P = self # the 2^k th symmetric power of self
+        while True:
+            if exp & 1:
+                L = P if L is None else P.symmetric_product(L, solver=solver)
+            exp >>= 1
+            if not exp:
+                return L
+            P = P.symmetric_product(P, solver=solver)
 
     def annihilator_of_associate(self, other, solver=None):
         """
@@ -1652,7 +1947,7 @@ class UnivariateOreOperator(OreOperator):
         if not isinstance(other, UnivariateOreOperator):
             raise TypeError("unexpected argument in symmetric_product")
 
-        if self.parent() != other.parent():
+        if self.parent() is not other.parent():
             A, B = canonical_coercion(self, other)
             return A.annihilator_of_associate(B, solver=solver)
 
@@ -1661,7 +1956,9 @@ class UnivariateOreOperator(OreOperator):
         elif other.is_zero():
             return self.parent().one()
 
-        R = self.base_ring().fraction_field()
+        R = self.base_ring()
+        if not R.is_field():
+            R = R.fraction_field()
         A = self.change_ring(R)
         a = A.order()
         B = other.change_ring(R) % A
@@ -1670,15 +1967,16 @@ class UnivariateOreOperator(OreOperator):
         if solver is None:
             solver = A.parent()._solver()
 
-        mat = [B.coefficients(sparse=False,padd=a-1)]
-
-        from sage.matrix.constructor import Matrix
-        sol = solver(Matrix(mat).transpose())
+        mat = []
+        kernel = _IncrementalKernel(R)
 
-        while len(sol) == 0:
-            B = (D*B) % A
+        while True:
+            # solve, but only once the new row (possibly) depends on the previous ones
             mat.append(B.coefficients(sparse=False,padd=a-1))
-            sol = solver(Matrix(mat).transpose())
+            sol = kernel.solve(mat, solver)
+            if len(sol) > 0:
+                break
+            B = (D*B) % A
 
         L = A.parent()(list(sol[0]))
         return L
@@ -1906,48 +2204,58 @@ class UnivariateOreOperator(OreOperator):
 
     # coefficient-related functions
     
+    # Operators are immutable, so the results of the following accessors can be
+    # cached on the operator.
+
+    @cached_method
     def order(self):
         """
         Returns the order of this operator, which is defined as the maximal power `i` of the
         generator which has a nonzero coefficient. The zero operator has order `-1`.
         """
-        return self.polynomial().degree()
+        return self._poly.degree()
 
+    @cached_method
     def valuation(self):
         r"""
         Returns the valuation of this operator, which is defined as the minimal power `i` of the
         generator which has a nonzero coefficient. The zero operator has order `\infty`.
         """
-        if self == self.parent().zero():
+        if not self._poly:
             return infinity
         else:
-            return min(self.exponents())
+            return min(self._exponents())
 
     def __getitem__(self, n):
-        return self.polynomial()[n]
+        return self._poly[n]
 
     def __setitem__(self, n, value):
         raise IndexError("Operators are immutable")
 
+    @cached_method
     def leading_coefficient(self):
-        return self.polynomial().leading_coefficient()
+        """
+        Return the leading coefficient of this operator. 
+        """
+        return self._poly.leading_coefficient()
 
+    @cached_method
     def constant_coefficient(self):
-        return self.polynomial()[0]
-
-    leading_coefficient.__doc__ = OreOperator.leading_coefficient.__doc__
-    constant_coefficient.__doc__ = OreOperator.constant_coefficient.__doc__
+        r"""
+        Return the coefficient of `\partial^0` of this operator. 
+        """
+        return self._poly[0]
 
     def map_coefficients(self, f, new_base_ring = None):
         """
         Returns the polynomial obtained by applying ``f`` to the non-zero
         coefficients of self.
         """
-        poly = self.polynomial().map_coefficients(f, new_base_ring = new_base_ring)
         if new_base_ring is None:
-            return self.parent()(poly)
-        else:
-            return self.parent().base_extend(new_base_ring)(poly)
+            # build the result directly from the coefficient list
+            return self.parent()([f(c) if c else c for c in self._poly.list()])
+        poly = self._poly.map_coefficients(f, new_base_ring = new_base_ring)
+        return self.parent().base_extend(new_base_ring)(poly)
 
     def coefficients(self, **args):
         """
@@ -1972,51 +2280,371 @@ class UnivariateOreOperator(OreOperator):
         padd = args.setdefault("padd", -1)
         args['padd'] = 0
         del args['padd']
-        c = self.polynomial().coefficients(**args)
+        if len(args) <= 1 and "sparse" in args and not args["sparse"]:
+            c = list(self._dense_coefficients())
+        elif args.get("sparse", True) and len(args) <= 1:
+            c = list(self._nonzero_coefficients())
+        else:
+            c = self._poly.coefficients(**args)
         if len(c) <= padd:
-            z = self.base_ring().zero()
-            c = c + [z for i in range(padd + 1 - len(c))]
+            c.extend([self.base_ring().zero()]*(padd + 1 - len(c)))
         return c
 
     def exponents(self):
-        return self.polynomial().exponents()
+        return list(self._exponents())
+
+    @cached_method
+    def _dense_coefficients(self):
+        return tuple(self._poly.list())
+
+    @cached_method
+    def _nonzero_coefficients(self):
+        return tuple(self._poly.coefficients())
+
+    @cached_method
+    def _exponents(self):
+        return tuple(self._poly.exponents())
 
     coefficients.__doc__ = OreOperator.coefficients.__doc__
     exponents.__doc__ = OreOperator.exponents.__doc__
 
 #############################################################################################################
 
-def __primitivePRS__(r,additional):
+def _times_D_kernel(Alg, sparse=False):
+    """
+    Returns a function which maps the coefficient list of an operator `B` to the
+    coefficient list of `D*B`, where `D` is the generator of the univariate Ore
+    algebra ``Alg``.
+
+    If ``sparse`` is set to ``True``, the function instead maps a dictionary
+    ``{j: b_j}`` of the nonzero coefficients of `B` to the corresponding
+    dictionary for `D*B`.
+
+    The function is specialized to the shape of the commutation rule, so that
+    no calls to ``sigma`` (or ``delta``) are made when it is the identity
+    (or zero). Coefficient lists are kept as plain lists of base ring elements
+    because of D*(b*D^j) = sigma(b)*D^(j+1) + delta(b)*D^j.
+    The functions are created once and then cached on ``Alg`` as ``_times_D_kernels``.
+    """
+    try:
+        return Alg._times_D_kernels[1 if sparse else 0]
+    except AttributeError:
+        pass
+
+    h = Alg._hot_cache()
+
+    sigma = h['sigma']
+    delta = h['delta']
+    zero = h['zero']
+
+    R = Alg.base_ring()
+    if is_PolynomialRing(R):
+        # Over a univariate polynomial ring such as GF(p)[x] or QQ[x], apply sigma and
+        # delta directly through the compiled polynomial arithmetic instead of going
+        # through the generic dispatch of Sigma_class and Delta_class.
+        x = R.gen()
+        if not h['sigma_is_identity']:
+            sx = sigma(x)
+            sigma = lambda c: c(sx)
+        elif not h['delta_is_zero']:
+            dx = delta(x)
+            delta = lambda c: c.derivative()*dx
+
+    if h['sigma_is_identity'] and h['delta_is_zero']:
+        def times_D(b):
+            return [zero] + b
+    elif h['sigma_is_identity']:
+        def times_D(b):
+            d = [delta(c) for c in b]
+            return [d[0]] + [b[j - 1] + d[j] for j in range(1, len(b))] + [b[-1]]
+    elif h['delta_is_zero']:
+        def times_D(b):
+            return [zero] + [sigma(c) for c in b]
+    else:
+        def times_D(b):
+            s = [sigma(c) for c in b]
+            d = [delta(c) for c in b]
+            return [d[0]] + [s[j - 1] + d[j] for j in range(1, len(b))] + [s[-1]]
+
+    sigma_is_identity = h['sigma_is_identity']
+    delta_is_zero = h['delta_is_zero']
+
+    def times_D_sparse(b):
+        out = {}
+        for j, c in b.items():
+            s = c if sigma_is_identity else sigma(c)
+            out[j + 1] = out[j + 1] + s if j + 1 in out else s
+            if not delta_is_zero:
+                d = delta(c)
+                if not d.is_zero():
+                    out[j] = out[j] + d if j in out else d
+        return {j: c for j, c in out.items() if not c.is_zero()}
+
+    Alg._times_D_kernels = (times_D, times_D_sparse)
+    return times_D_sparse if sparse else times_D
+
+def _push_kernel(Alg):
+    """
+    Returns the function which performs the push step of ``symmetric_product``
+    for operators in the univariate Ore algebra ``Alg``.
+
+    The function takes the flat table ``Dkuv`` of the coefficients of `D^i(u)*D^j(v)`,
+    whose rows have length `m`, together with the list ``cells`` of the flat indices of
+    all `(i, j)` with `i < a` and `j < b` in decreasing order, and replaces the normal
+    form of `D^k(u*v)` stored there by the one of `D^(k+1)(u*v)`. Entries in the last
+    row and column are not reduced.
+
+    The function is specialized to the product rule `(w_0,w_1,w_2)` of ``Alg``: for
+    derivations (`\sigma=1`, rule `(0,1,0)`) and for automorphisms (`\delta=0`, rule
+    `(0,0,1)`) no multiplications by the rule coefficients are made at all.
+    The function is created once and then cached on ``Alg`` as ``_symprod_push``.
+    """
+    try:
+        return Alg._symprod_push
+    except AttributeError:
+        pass
+
+    h = Alg._hot_cache()
+
+    sigma = h['sigma']
+    delta = h['delta']
+    zero = h['zero']
+    R = Alg.base_ring()
+    pr0, pr1, pr2 = (R(w) for w in Alg._product_rule()[:3])
+
+    if h['sigma_is_identity'] and pr0.is_zero() and pr1.is_one() and pr2.is_zero():
+        def push(Dkuv, cells, m):
+            for ij in cells:
+                v = Dkuv[ij]
+                if not v.is_zero():
+                    Dkuv[ij + 1] += v
+                    Dkuv[ij + m] += v
+                    Dkuv[ij] = delta(v)
+    elif h['delta_is_zero'] and pr0.is_zero() and pr1.is_zero() and pr2.is_one():
+        def push(Dkuv, cells, m):
+            for ij in cells:
+                v = Dkuv[ij]
+                if not v.is_zero():
+                    Dkuv[ij + m + 1] += sigma(v)
+                    Dkuv[ij] = zero
+    else:
+        def push(Dkuv, cells, m):
+            for ij in cells:
+                v = Dkuv[ij]
+                if v.is_zero():
+                    continue
+                s = sigma(v)
+                if pr2:
+                    Dkuv[ij + m + 1] += s*pr2
+                if pr1:
+                    t = s*pr1
+                    Dkuv[ij + 1] += t
+                    Dkuv[ij + m] += t
+                Dkuv[ij] = delta(v) + s*pr0 if pr0 else delta(v)
+
+    Alg._symprod_push = push
+    return push
+
+def _coprime_mod_p(polys):
+    """
+    Returns ``True`` if the given univariate polynomials over `ZZ` or `QQ` are certainly
+    coprime up to constant factors, and ``False`` if this could not be established.
+
+    The gcd is taken modulo a word size prime which divides neither the leading coefficient
+    of a polynomial of minimal degree nor any denominator. Modulo such a prime, the degree
+    of the gcd can only go up, so a trivial modular gcd proves that the true gcd is trivial.
+    """
+    Rp = polys[0].parent().change_ring(GF(_WORD_PRIME))
+    pmin = min(polys, key=lambda q: q.degree())
+    try:
+        g = Rp(pmin)
+        if g.degree() < pmin.degree():
+            return False
+        for q in polys:
+            g = g.gcd(Rp(q))
+            if g.degree() == 0:
+                return True
+    except ArithmeticError:
+        pass
+    return False
+
+def _classic_prs_is_cheap(L1, L2):
+    """
+    Decides whether the classic PRS is preferable to a fraction free PRS for computing
+    the gcrd of two operators over a field of rational functions.
+
+    The classic PRS only wins for operators of small order with coefficients of small
+    degree, where the growth of the rational function coefficients does not yet matter.
+    """
+    if max(L1.order(), L2.order()) > 3:
+        return False
+    for L in (L1, L2):
+        for c in L:
+            if max(c.numerator().degree(), c.denominator().degree()) > 4:
+                return False
+    return True
+
+class _IncrementalKernel(object):
+    """
+    Detects the first linear dependence in a growing sequence of vectors over a field `R`.
+
+    The vectors are passed one at a time to ``add``, which reduces the new vector against
+    the echelon form of its predecessors, so that every vector is eliminated only once.
+    If `R` is `QQ`, the elimination is performed on the images of the vectors modulo a
+    word size prime, and if `R` is a field of rational functions over `ZZ` or `QQ` in one
+    variable, on their images under evaluation at a random point modulo such a prime.
+    Vectors whose images are linearly independent are linearly independent themselves,
+    while a dependence among the images may in rare cases be accidental and has to be
+    confirmed by the caller.
+
+    The method ``solve`` combines this test with calls to a solver. It assumes that the
+    vectors form a Krylov sequence, i.e., once a vector depends on its predecessors, so do
+    all subsequent ones.
+    """
+
+    def __init__(self, R):
+        self._R = R
+        self._phi = lambda c: c
+        K = _WORD_PRIME_FIELD
+        if R is QQ:
+            self._phi = lambda c: K(c)
+        elif is_FractionField(R):
+            P = R.ring()
+            if is_PolynomialRing(P) and P.base_ring() in (ZZ, QQ):
+                Pp = P.change_ring(K)
+                x0 = K.random_element()
+                self._phi = lambda c: Pp(c.numerator())(x0)/Pp(c.denominator())(x0)
+        self._rows = [] # pairs (pivot index, reduced vector with a one at the pivot)
+        self._pending = None # number of vectors not yet checked, once the images are useless
+
+    def add(self, vec):
+        """
+        Returns ``True`` if ``vec`` (possibly) depends linearly on the vectors added so far,
+        and ``False`` if it is certainly linearly independent of them.
+        """
+        try:
+            w = [self._phi(c) for c in vec]
+        except ArithmeticError:
+            return True
+        for (piv, row) in self._rows:
+            c = w[piv]
+            if c:
+                for j in range(piv, len(w)):
+                    w[j] -= c*row[j]
+        for piv in range(len(w)):
+            if w[piv]:
+                c = ~w[piv]
+                self._rows.append((piv, [c*u for u in w]))
+                return False
+        return True
+
+    def solve(self, mat, solver):
+        """
+        To be called whenever a new vector was appended to the list ``mat``. Returns the
+        kernel computed by ``solver`` for the matrix with columns ``mat[:k+1]``, where `k`
+        is the index of the first vector which depends on its predecessors, or an empty
+        list if there is no such vector (yet).
+        """
+        from sage.matrix.constructor import Matrix
+
+        R = self._R
+        if self._pending is None:
+            if not self.add(mat[-1]):
+                return []
+            sol = solver(Matrix(R, mat).transpose())
+            if len(sol) > 0:
+                return sol
+            # accidental dependence of the images; from now on, ask the solver,
+            # but only for every quarter by which the matrix grows
+            self._pending = 0
+            return []
+
+        self._pending += 1
+        if self._pending < max(1, len(mat) >> 2):
+            return []
+        self._pending = 0
+        sol = solver(Matrix(R, mat).transpose())
+        # for a Krylov sequence, the kernel has dimension len(mat) - k
+        while len(sol) > 1:
+            del mat[len(mat) - len(sol) + 1:]
+            sol = solver(Matrix(R, mat).transpose())
+        return sol
+
+def _exact_div(L, beta):
+    """
+    Divides all coefficients of the operator ``L`` exactly by the element ``beta`` of its base ring.
+
+    Divisions by `1` and `-1`, which are frequent in the fraction free PRS, are performed
+    without touching the coefficients one by one. Over `ZZ[x]`, a constant ``beta`` is
+    turned into an integer, so that each coefficient is divided by a scalar rather than
+    by a polynomial.
+    """
+    if beta.is_one():
+        return L
+    elif (-beta).is_one():
+        return -L
+    R = L.base_ring()
+    if is_PolynomialRing(R) and R.base_ring() is ZZ and beta.degree() == 0:
+        beta = beta[0]
+    return L.parent()([p//beta for p in L.list()])
+
+def _phi_factorials(sigma, sphi, n):
+    """
+    Returns the sigma-factorials of ``sphi`` of length `n` and `n-1`, computing only one of them.
+
+    The PRS steps need the former for ``beta`` and the latter in the next step for ``phi``.
+    The second entry is ``None`` if `n` is zero.
+    """
+    if n == 0:
+        return (sphi.parent().one(), None)
+    prefix = sigma.factorial(sphi, n - 1)
+    return (prefix*sigma(sphi, n - 1), prefix)
+
+def _pseudo_quo_rem(p, q, quotient):
+    """
+    Fraction free division of ``p`` by ``q`` for the PRS step functions; the
+    quotient is ``None`` if ``quotient`` is ``False``.
+    """
+    if quotient:
+        return p.quo_rem(q, fractionFree=True)
+    return (None, p._quo_rem(q, True, False))
+
+def __primitivePRS__(r,additional,quotient=True):
     """
     Computes one division step in the primitive polynomial remainder sequence.
+
+    If ``quotient`` is ``False``, the quotient is not computed and ``None`` is
+    returned in its place. The same holds for the other PRS step functions.
     """
 
     orddiff = r[0].order()-r[1].order()
 
-    R = r[0].parent()
-    alpha = R.sigma().factorial(r[1].leading_coefficient(),orddiff+1)
-    newRem = (alpha*r[0]).quo_rem(r[1],fractionFree=True)
+    sigma = r[0].parent().sigma()
+    alpha = sigma.factorial(r[1].leading_coefficient(),orddiff+1)
+    newRem = _pseudo_quo_rem(alpha*r[0], r[1], quotient)
     beta = newRem[1].content()
-    r2 = newRem[1].map_coefficients(lambda p: p//beta)
+    r2 = _exact_div(newRem[1], beta)
     
     return ((r[1],r2),newRem[0],alpha,beta,True)
 
-def __classicPRS__(r,additional):
+def __classicPRS__(r,additional,quotient=True):
     """
     Computes one division step in the classic polynomial remainder sequence.
     """
 
-    newRem = r[0].quo_rem(r[1])
-    return ((r[1],newRem[1]),newRem[0],r[0].parent().base_ring().one(),r[0].parent().base_ring().one(),True)
+    one = r[0].parent().base_ring().one()
+    newRem = r[0].quo_rem(r[1]) if quotient else (None, r[0] % r[1])
+    return ((r[1],newRem[1]),newRem[0],one,one,True)
 
-def __monicPRS__(r,additional):
+def __monicPRS__(r,additional,quotient=True):
     """
     Computes one division step in the monic polynomial remainder sequence.
     """
 
-    newRem = r[0].quo_rem(r[1])
-    beta = newRem[1].leading_coefficient() if not newRem[1].is_zero() else r[0].parent().base_ring().one()
-    return ((r[1],newRem[1].primitive_part()),newRem[0],r[0].parent().base_ring().one(),beta,True)
+    one = r[0].parent().base_ring().one()
+    newRem = r[0].quo_rem(r[1]) if quotient else (None, r[0] % r[1])
+    beta = newRem[1].leading_coefficient() if not newRem[1].is_zero() else one
+    return ((r[1],newRem[1].primitive_part()),newRem[0],one,beta,True)
 
 #def __essentialPRS__(r,additional):
 #    """
@@ -2054,7 +2682,7 @@ def __monicPRS__(r,additional):
 
 #    return ((r[1],r2),newRem[0],alpha2,beta,True)
 
-def __essentialPRS__(r,additional):
+def __essentialPRS__(r,additional,quotient=True):
     """
     Computes one division step in the essential polynomial remainder sequence.
     """
@@ -2067,31 +2695,38 @@ def __essentialPRS__(r,additional):
     Rbase = R.base_ring()
     sigma = R.sigma()
 
+    factorial = sigma.factorial
+
     if (len(additional)==0):
-        phi = -Rbase.one()
+        sphi = sigma(-Rbase.one(),1)
         initD=d0+d1
         essentialPart = sigma(gcd(sigma(r[0].leading_coefficient(),-orddiff),r[1].leading_coefficient()),-d0)
         gamma1 = 1
-        gamma2 = sigma.factorial(sigma(essentialPart,d0),orddiff+1)
-        beta = (-Rbase.one())*sigma.factorial(sigma(phi,1),orddiff)*gamma2
+        gamma2 = factorial(sigma(essentialPart,d0),orddiff+1)
+        (phifact, prefix) = _phi_factorials(sigma, sphi, orddiff)
+        beta = (-Rbase.one())*phifact*gamma2
     else:
-        (initD,essentialPart,gamma0,gamma1,d2,phi) = (additional.pop(),additional.pop(),additional.pop(),additional.pop(),additional.pop(),additional.pop())
+        (initD,essentialPart,gamma0,gamma1,d2,sphi,prefix) = tuple(additional.pop() for i in range(7))
         orddiff2 = d2-d1
-        gamma2 = sigma.factorial(sigma(essentialPart,d1),orddiff2)*gamma1*sigma.factorial(sigma(essentialPart,initD-d0+1),orddiff2)
-        phi = sigma.factorial(-gamma0*r[0].leading_coefficient(),orddiff2) / sigma.factorial(sigma(phi,1),orddiff2-1)
-        beta = (-Rbase.one())*sigma.factorial(sigma(phi,1),orddiff)*r[0].leading_coefficient()*gamma2/sigma.factorial(gamma1,orddiff+1)
-
-    alpha = sigma.factorial(r[1].leading_coefficient(),orddiff+1)
-    newRem = (alpha*r[0]).quo_rem(r[1],fractionFree=True)
+        gamma2 = factorial(sigma(essentialPart,d1),orddiff2)*gamma1*factorial(sigma(essentialPart,initD-d0+1),orddiff2)
+        if prefix is None:
+            prefix = factorial(sphi,orddiff2-1)
+        phi = factorial(-gamma0*r[0].leading_coefficient(),orddiff2) / prefix
+        sphi = sigma(phi,1)
+        (phifact, prefix) = _phi_factorials(sigma, sphi, orddiff)
+        beta = (-Rbase.one())*phifact*r[0].leading_coefficient()*gamma2/factorial(gamma1,orddiff+1)
+
+    alpha = factorial(r[1].leading_coefficient(),orddiff+1)
+    newRem = _pseudo_quo_rem(alpha*r[0], r[1], quotient)
     try:
         r2 = newRem[1].map_coefficients(lambda p: p/beta)
     except:
         return ((0,0),0,0,0,False)
-    additional.extend([phi,d1,gamma2,gamma1,essentialPart,initD])
+    additional.extend([prefix,sphi,d1,gamma2,gamma1,essentialPart,initD])
 
     return ((r[1],r2),newRem[0],alpha,beta,True)
 
-def __subresultantPRS__(r,additional):
+def __subresultantPRS__(r,additional,quotient=True):
     """
     Computes one division step in the subresultant polynomial remainder sequence.
     """
@@ -2104,18 +2739,25 @@ def __subresultantPRS__(r,additional):
     Rbase = R.base_ring()
     sigma = R.sigma()
 
+    factorial = sigma.factorial
+
     if (len(additional)==0):
-        phi = -Rbase.one()
-        beta = (-Rbase.one())*sigma.factorial(sigma(phi,1),orddiff)
+        sphi = sigma(-Rbase.one(),1)
+        (phifact, prefix) = _phi_factorials(sigma, sphi, orddiff)
+        beta = (-Rbase.one())*phifact
     else:
-        (d2,phi) = (additional.pop(),additional.pop())
+        (d2,sphi,prefix) = (additional.pop(),additional.pop(),additional.pop())
         orddiff2 = d2-d1
-        phi = sigma.factorial(-r[0].leading_coefficient(),orddiff2) / sigma.factorial(sigma(phi,1),orddiff2-1)
-        beta = (-Rbase.one())*sigma.factorial(sigma(phi,1),orddiff)*r[0].leading_coefficient()
-
-    alpha = sigma.factorial(r[1].leading_coefficient(),orddiff+1)
-    newRem = (alpha*r[0]).quo_rem(r[1],fractionFree=True)
-    r2 = newRem[1].map_coefficients(lambda p: p//beta)
-    additional.extend([phi,d1])
+        if prefix is None:
+            prefix = factorial(sphi,orddiff2-1)
+        phi = factorial(-r[0].leading_coefficient(),orddiff2) / prefix
+        sphi = sigma(phi,1)
+        (phifact, prefix) = _phi_factorials(sigma, sphi, orddiff)
+        beta = (-Rbase.one())*phifact*r[0].leading_coefficient()
+
+    alpha = factorial(r[1].leading_coefficient(),orddiff+1)
+    newRem = _pseudo_quo_rem(alpha*r[0], r[1], quotient)
+    r2 = _exact_div(newRem[1], beta)
+    additional.extend([prefix,sphi,d1])
 
     return ((r[1],r2),newRem[0],alpha,beta,True)